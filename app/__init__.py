@@ -2,6 +2,7 @@
 JupyterHub monitoring application.
 """
 
+from app.async_elasticsearch_client import AsyncElasticsearchClient
 from app.elasticsearch_client import ElasticsearchClient
 
-__all__ = ["ElasticsearchClient"]
+__all__ = ["AsyncElasticsearchClient", "ElasticsearchClient"]
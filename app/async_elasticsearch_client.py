@@ -0,0 +1,314 @@
+"""
+Asynchronous Elasticsearch client wrapper for querying and uploading documents.
+"""
+
+# This client deliberately mirrors the synchronous one.
+# pylint: disable=duplicate-code
+
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.helpers import async_streaming_bulk
+
+from app.elasticsearch_common import (
+    KEEP_ALIVE,
+    MAX_CHUNK_BYTES,
+    build_connection_params,
+    build_page_body,
+    build_query_body,
+    expand_action,
+)
+
+
+class AsyncElasticsearchClient:
+    """
+    A wrapper around the official asynchronous Python client for Elasticsearch.
+
+    This class mirrors `ElasticsearchClient`, but its methods are coroutines,
+    so that many queries and uploads can be in flight at once, for example:
+
+        async with AsyncElasticsearchClient(endpoint, api_key) as client:
+            await asyncio.gather(*(consume(client.query(index, q)) for q in queries))
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        ca_cert: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the Elasticsearch client.
+
+        The connection is not validated until `connect` is called, which
+        happens automatically when the client is used as a context manager.
+
+        Args:
+            endpoint: The Elasticsearch API endpoint URL (e.g., "https://localhost:9200")
+            api_key: The API key for authentication
+            ca_cert: Optional path to the CA certificate file for TLS verification
+        """
+        self._endpoint = endpoint
+        self._client = AsyncElasticsearch(**build_connection_params(endpoint, api_key, ca_cert))
+
+    async def connect(self) -> None:
+        """
+        Validate the connection to Elasticsearch.
+
+        Raises:
+            ConnectionError: If unable to connect to the Elasticsearch endpoint
+        """
+        try:
+            if not await self._client.ping():
+                raise ConnectionError(f"Unable to connect to Elasticsearch at {self._endpoint}")
+        except Exception as e:
+            raise ConnectionError(
+                f"Failed to connect to Elasticsearch at {self._endpoint}: {str(e)}"
+            ) from e
+
+    async def upload_document(
+        self,
+        index: str,
+        document: Dict[str, Any],
+        doc_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload a single document to an Elasticsearch index.
+
+        Args:
+            index: The name of the index to upload to
+            document: The document to upload (as a dictionary)
+            doc_id: Optional document ID. If not provided, Elasticsearch generates one
+
+        Returns:
+            The response from Elasticsearch containing the upload result
+
+        Raises:
+            Exception: If the upload fails
+        """
+        client = self._client
+        if doc_id is None:
+            # Retrying would index a duplicate document if the request
+            # timed out after the server completed it
+            client = client.options(retry_on_timeout=False)
+
+        return cast(
+            Dict[str, Any],
+            await client.index(index=index, id=doc_id, document=document),
+        )
+
+    async def upload_documents(
+        self,
+        index: str,
+        documents: Iterable[Dict[str, Any]],
+        chunk_size: int = 500,
+        request_timeout: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[bool, Dict[str, Any]]]:
+        """
+        Upload multiple documents to an Elasticsearch index using the bulk API.
+
+        The result for each document is yielded as soon as its batch has been
+        sent, and nothing is uploaded until the returned iterator is consumed.
+
+        Args:
+            index: The name of the index to upload to
+            documents: An iterable yielding documents (as dictionaries)
+            chunk_size: Number of documents to send per bulk request (default: 500)
+            request_timeout: Optional timeout in seconds for each bulk request
+
+        Returns:
+            An asynchronous iterator yielding a (success, result) tuple for each
+            uploaded document
+
+        Raises:
+            Exception: If a bulk request fails
+        """
+        # Retrying would index duplicate documents if a request timed out
+        # after the server completed it
+        client = self._client.options(retry_on_timeout=False)
+        if request_timeout is not None:
+            client = client.options(request_timeout=request_timeout)
+
+        async for ok, item in async_streaming_bulk(
+            client,
+            documents,
+            chunk_size=chunk_size,
+            max_chunk_bytes=MAX_CHUNK_BYTES,
+            raise_on_error=False,
+            expand_action_callback=expand_action(index),
+        ):
+            yield ok, item
+
+    async def upload_documents_count(
+        self,
+        index: str,
+        documents: Iterable[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> int:
+        """
+        Upload multiple documents to an Elasticsearch index using the bulk API.
+
+        This method accepts the same arguments as `upload_documents`, but
+        only keeps track of the number of documents that were uploaded.
+
+        Args:
+            index: The name of the index to upload to
+            documents: An iterable yielding documents (as dictionaries)
+            **kwargs: Additional arguments for `upload_documents`
+
+        Returns:
+            The number of documents that were uploaded successfully
+
+        Raises:
+            Exception: If a bulk request fails
+        """
+        count = 0
+        async for ok, _ in self.upload_documents(index, documents, **kwargs):
+            if ok:
+                count += 1
+        return count
+
+    async def query(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]] = None,
+        query_string: Optional[str] = None,
+        size: int = 100,
+        request_cache: Optional[bool] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Query an Elasticsearch index and return an asynchronous iterator over the results.
+
+        Pagination is handled the same way as by `ElasticsearchClient.query`.
+
+        Args:
+            index: The name of the index to query
+            query: Optional Query DSL query (as a dictionary)
+            query_string: Optional Kibana-style query string (e.g., "status:200 AND user:john")
+            size: Number of documents to retrieve per search request (default: 100)
+            request_cache: Optional override for whether to use the shard request
+                cache. If not provided, the index's setting is used. Each page is
+                requested with a new point in time, so cache hits are unlikely
+
+        Returns:
+            An asynchronous iterator yielding documents matching the query
+
+        Raises:
+            Exception: If the query fails
+        """
+        batches = self.query_batches(
+            index=index,
+            query=query,
+            query_string=query_string,
+            size=size,
+            request_cache=request_cache,
+        )
+
+        try:
+            async for batch in batches:
+                for document in batch:
+                    yield document
+        finally:
+            await batches.aclose()
+
+    async def query_batches(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]] = None,
+        query_string: Optional[str] = None,
+        size: int = 100,
+        raw_source: bool = False,
+        request_cache: Optional[bool] = None,
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Query an Elasticsearch index and return an asynchronous iterator over pages of results.
+
+        This method behaves like `query`, but yields one list of documents per
+        page instead of one document at a time.
+
+        Args:
+            index: The name of the index to query
+            query: Optional Query DSL query (as a dictionary)
+            query_string: Optional Kibana-style query string (e.g., "status:200 AND user:john")
+            size: Number of documents to retrieve per search request (default: 100)
+            raw_source: If True, yield the raw hits, including their metadata,
+                instead of only their `_source` (default: False)
+            request_cache: Optional override for whether to use the shard request
+                cache. If not provided, the index's setting is used. Each page is
+                requested with a new point in time, so cache hits are unlikely
+
+        Returns:
+            An asynchronous iterator yielding lists of documents (or hits) matching the query
+
+        Raises:
+            Exception: If the query fails
+        """
+        query_body = build_query_body(query, query_string)
+
+        # Open a point in time
+        response = await self._client.open_point_in_time(index=index, keep_alive=KEEP_ALIVE)
+        pit_id = response["id"]
+
+        try:
+            search_after: Optional[List[Any]] = None
+
+            # Continue searching until no more results
+            while True:
+                page_body = build_page_body(query_body, pit_id, size, search_after)
+
+                response = await self._client.search(
+                    body=page_body,
+                    request_cache=request_cache,
+                )
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+
+                if not hits:
+                    break
+
+                if raw_source:
+                    yield hits
+                else:
+                    yield [hit["_source"] for hit in hits]
+                search_after = hits[-1]["sort"]
+
+        finally:
+            # Clean up the point in time
+            try:
+                await self._client.close_point_in_time(id=pit_id)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Ignore errors when closing the point in time - cleanup
+                # failures should not mask results
+                pass
+
+    async def close(self) -> None:
+        """
+        Close the Elasticsearch client connection.
+
+        It's recommended to call this method when done using the client,
+        or use the client as an asynchronous context manager.
+        """
+        await self._client.close()
+
+    async def __aenter__(self) -> "AsyncElasticsearchClient":
+        """Support for asynchronous context manager protocol."""
+        try:
+            await self.connect()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Support for asynchronous context manager protocol."""
+        await self.close()
@@ -2,9 +2,134 @@
 Elasticsearch client wrapper for querying and uploading documents.
 """
 
-from typing import Any, Dict, Iterator, List, Optional, cast
+import queue
+import threading
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from elasticsearch import Elasticsearch
+from elasticsearch.helpers import parallel_bulk, streaming_bulk
+
+from app.elasticsearch_common import (
+    KEEP_ALIVE,
+    MAX_CHUNK_BYTES,
+    build_connection_params,
+    build_page_body,
+    build_query_body,
+    expand_action,
+)
+
+T = TypeVar("T")
+
+# Marks the end of the items produced by a background thread
+_DONE = object()
+
+
+class _Failure(NamedTuple):
+    """Wraps an exception raised by a background thread."""
+
+    error: BaseException
+
+
+def _prefetch(items: Iterator[T], depth: int) -> Generator[T, None, None]:
+    """
+    Consume an iterator on a background thread, buffering up to `depth` items.
+
+    This allows the work of producing the next items (e.g., network requests)
+    to overlap with the caller's processing of the current item.
+
+    Args:
+        items: The iterator to consume in the background
+        depth: The maximum number of items to buffer ahead of the caller
+
+    Returns:
+        An iterator yielding the same items in the same order
+
+    Raises:
+        Exception: Any exception raised while producing items
+    """
+    return _merge([items], depth)
+
+
+def _merge(sources: Sequence[Iterator[T]], depth: int) -> Generator[T, None, None]:
+    """
+    Consume several iterators concurrently, each on its own background thread.
+
+    Items are yielded in the order in which they are produced, so the items
+    from different iterators may be interleaved.
+
+    Args:
+        sources: The iterators to consume in the background
+        depth: The maximum number of items to buffer ahead of the caller
+
+    Returns:
+        An iterator yielding the items from all of the iterators
+
+    Raises:
+        Exception: Any exception raised while producing items
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce(items: Iterator[T]) -> None:
+        # Always tell the consumer that this thread is finished, so that it
+        # does not wait forever for items that will never arrive
+        outcome: Any = _DONE
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            # Hand the exception over to the consumer to re-raise
+            outcome = _Failure(e)
+        finally:
+            try:
+                close = getattr(items, "close", None)
+                if close is not None:
+                    close()
+            finally:
+                put(outcome)
+
+    producers = [
+        threading.Thread(target=produce, args=(items,), daemon=True) for items in sources
+    ]
+    for producer in producers:
+        producer.start()
+
+    try:
+        remaining = len(producers)
+        while remaining:
+            item = buffer.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(item, _Failure):
+                raise item.error
+            yield cast(T, item)
+    finally:
+        stop.set()
+        for producer in producers:
+            producer.join()
 
 
 class ElasticsearchClient:
@@ -33,19 +158,8 @@ class ElasticsearchClient:
             ConnectionError: If unable to connect to the Elasticsearch endpoint
             ValueError: If authentication fails or endpoint is invalid
         """
-        # Build connection parameters
-        connection_params: Dict[str, Any] = {
-            "hosts": [endpoint],
-            "api_key": api_key,
-        }
-
-        # Add CA certificate if provided
-        if ca_cert is not None:
-            connection_params["ca_certs"] = ca_cert
-            connection_params["verify_certs"] = True
-
         # Initialize the Elasticsearch client
-        self._client = Elasticsearch(**connection_params)
+        self._client = Elasticsearch(**build_connection_params(endpoint, api_key, ca_cert))
 
         # Validate the connection
         try:
@@ -76,36 +190,102 @@ class ElasticsearchClient:
         Raises:
             Exception: If the upload fails
         """
-        return cast(
-            Dict[str, Any], self._client.index(index=index, id=doc_id, document=document)
-        )
+        client = self._client
+        if doc_id is None:
+            # Retrying would index a duplicate document if the request
+            # timed out after the server completed it
+            client = client.options(retry_on_timeout=False)
+
+        return cast(Dict[str, Any], client.index(index=index, id=doc_id, document=document))
 
     def upload_documents(
         self,
         index: str,
         documents: Iterator[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+        chunk_size: int = 500,
+        request_timeout: Optional[float] = None,
+        thread_count: Optional[int] = None,
+    ) -> Iterator[Tuple[bool, Dict[str, Any]]]:
         """
         Upload multiple documents to an Elasticsearch index from an iterator.
 
         This method accepts any iterator (e.g., list, generator) and uploads
-        all documents returned by it.
+        all documents returned by it. Documents are sent in batches using the
+        bulk API rather than one request per document.
+
+        The result for each document is yielded as soon as its batch has been
+        sent, and nothing is uploaded until the returned iterator is consumed.
+        Callers that only need the number of uploaded documents should use
+        `upload_documents_count` instead.
 
         Args:
             index: The name of the index to upload to
             documents: An iterator yielding documents (as dictionaries)
+            chunk_size: Number of documents to send per bulk request (default: 500)
+            request_timeout: Optional timeout in seconds for each bulk request
+            thread_count: Optional number of threads to use for sending bulk
+                requests in parallel. If not provided, requests are sent serially
 
         Returns:
-            A list of responses from Elasticsearch for each uploaded document
+            An iterator yielding a (success, result) tuple for each uploaded document
 
         Raises:
-            Exception: If any upload fails
+            Exception: If a bulk request fails
         """
-        results = []
-        for document in documents:
-            result = self.upload_document(index=index, document=document)
-            results.append(result)
-        return results
+        # Retrying would index duplicate documents if a request timed out
+        # after the server completed it
+        client = self._client.options(retry_on_timeout=False)
+        if request_timeout is not None:
+            client = client.options(request_timeout=request_timeout)
+
+        options: Dict[str, Any] = {
+            "chunk_size": chunk_size,
+            "max_chunk_bytes": MAX_CHUNK_BYTES,
+            "raise_on_error": False,
+            "expand_action_callback": expand_action(index),
+        }
+
+        if thread_count is not None:
+            results = parallel_bulk(
+                client,
+                documents,
+                thread_count=thread_count,
+                queue_size=4,
+                **options,
+            )
+        else:
+            results = streaming_bulk(client, documents, **options)
+
+        yield from results
+
+    def upload_documents_count(
+        self,
+        index: str,
+        documents: Iterator[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> int:
+        """
+        Upload multiple documents to an Elasticsearch index from an iterator.
+
+        This method accepts the same arguments as `upload_documents`, but
+        only keeps track of the number of documents that were uploaded.
+
+        Args:
+            index: The name of the index to upload to
+            documents: An iterator yielding documents (as dictionaries)
+            **kwargs: Additional arguments for `upload_documents`
+
+        Returns:
+            The number of documents that were uploaded successfully
+
+        Raises:
+            Exception: If a bulk request fails
+        """
+        count = 0
+        for ok, _ in self.upload_documents(index, documents, **kwargs):
+            if ok:
+                count += 1
+        return count
 
     def query(
         self,
@@ -113,12 +293,16 @@ class ElasticsearchClient:
         query: Optional[Dict[str, Any]] = None,
         query_string: Optional[str] = None,
         size: int = 100,
+        prefetch: int = 1,
+        request_cache: Optional[bool] = None,
     ) -> Iterator[Dict[str, Any]]:
         """
         Query an Elasticsearch index and return an iterator over the results.
 
-        This method automatically handles pagination using the scroll API,
-        so the caller doesn't need to worry about large result sets.
+        This method automatically handles pagination using a point in time and
+        `search_after`, so the caller doesn't need to worry about large result
+        sets. The next pages of results are fetched in the background while the
+        caller processes the current page.
 
         Supports both structured Query DSL queries and Kibana-style query strings.
 
@@ -126,7 +310,12 @@ class ElasticsearchClient:
             index: The name of the index to query
             query: Optional Query DSL query (as a dictionary)
             query_string: Optional Kibana-style query string (e.g., "status:200 AND user:john")
-            size: Number of documents to retrieve per scroll request (default: 100)
+            size: Number of documents to retrieve per search request (default: 100)
+            prefetch: Number of pages to fetch ahead of the caller (default: 1).
+                If 0, pages are fetched only when the caller needs them
+            request_cache: Optional override for whether to use the shard request
+                cache. If not provided, the index's setting is used. Each page is
+                requested with a new point in time, so cache hits are unlikely
 
         Returns:
             An iterator yielding documents matching the query
@@ -148,62 +337,227 @@ class ElasticsearchClient:
                 query_string="status:error AND level:critical"
             )
         """
-        # Build the query body
-        query_body: Dict[str, Any] = {}
-
-        if query is not None:
-            # Use the provided Query DSL query
-            query_body["query"] = query
-        elif query_string is not None:
-            # Convert query string to Query DSL
-            query_body["query"] = {
-                "query_string": {
-                    "query": query_string,
-                }
-            }
-        else:
-            # If no query provided, match all documents
-            query_body["query"] = {"match_all": {}}
+        batches = self.query_batches(
+            index=index,
+            query=query,
+            query_string=query_string,
+            size=size,
+            prefetch=prefetch,
+            request_cache=request_cache,
+        )
+
+        try:
+            for batch in batches:
+                yield from batch
+        finally:
+            batches.close()
+
+    def query_batches(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]] = None,
+        query_string: Optional[str] = None,
+        size: int = 100,
+        prefetch: int = 1,
+        raw_source: bool = False,
+        request_cache: Optional[bool] = None,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Query an Elasticsearch index and return an iterator over pages of results.
+
+        This method behaves like `query`, but yields one list of documents per
+        page instead of one document at a time, which avoids per-document
+        overhead when the caller processes documents in bulk.
+
+        Args:
+            index: The name of the index to query
+            query: Optional Query DSL query (as a dictionary)
+            query_string: Optional Kibana-style query string (e.g., "status:200 AND user:john")
+            size: Number of documents to retrieve per search request (default: 100)
+            prefetch: Number of pages to fetch ahead of the caller (default: 1).
+                If 0, pages are fetched only when the caller needs them
+            raw_source: If True, yield the raw hits, including their metadata,
+                instead of only their `_source` (default: False)
+            request_cache: Optional override for whether to use the shard request
+                cache. If not provided, the index's setting is used. Each page is
+                requested with a new point in time, so cache hits are unlikely
 
-        # Initialize scroll
-        scroll_timeout = "2m"
-        response = self._client.search(
+        Returns:
+            An iterator yielding lists of documents (or hits) matching the query
+
+        Raises:
+            Exception: If the query fails
+        """
+        query_body = build_query_body(query, query_string)
+
+        pages = self._paginate(
             index=index,
             body=query_body,
-            scroll=scroll_timeout,
             size=size,
+            request_cache=request_cache,
         )
-
-        # Get the scroll ID
-        scroll_id = response.get("_scroll_id")
+        if prefetch > 0:
+            pages = _prefetch(pages, prefetch)
 
         try:
-            # Yield documents from the first batch
-            hits = response["hits"]["hits"]
-            for hit in hits:
-                yield hit["_source"]
-
-            # Continue scrolling until no more results
-            while hits:
-                response = self._client.scroll(
-                    scroll_id=scroll_id,
-                    scroll=scroll_timeout,
-                )
-                scroll_id = response.get("_scroll_id")
-                hits = response["hits"]["hits"]
+            for hits in pages:
+                if raw_source:
+                    yield hits
+                else:
+                    yield [hit["_source"] for hit in hits]
+        finally:
+            pages.close()
 
+    def parallel_query(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]] = None,
+        query_string: Optional[str] = None,
+        size: int = 100,
+        slices: int = 4,
+        request_cache: Optional[bool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Query an Elasticsearch index using several concurrent searches.
+
+        The results are split into `slices` parts, each of which is retrieved
+        on its own background thread. This is most useful for queries that
+        match a large part of an index with several primary shards.
+
+        Unlike `query`, the order in which documents are returned is not
+        deterministic.
+
+        Args:
+            index: The name of the index to query
+            query: Optional Query DSL query (as a dictionary)
+            query_string: Optional Kibana-style query string (e.g., "status:200 AND user:john")
+            size: Number of documents to retrieve per search request (default: 100)
+            slices: Number of concurrent searches (default: 4)
+            request_cache: Optional override for whether to use the shard request
+                cache. If not provided, the index's setting is used. Each page is
+                requested with a new point in time, so cache hits are unlikely
+
+        Returns:
+            An iterator yielding documents matching the query
+
+        Raises:
+            Exception: If the query fails
+        """
+        query_body = build_query_body(query, query_string)
+
+        pages = self._paginate(
+            index=index,
+            body=query_body,
+            size=size,
+            request_cache=request_cache,
+            slices=slices,
+        )
+
+        try:
+            for hits in pages:
                 for hit in hits:
                     yield hit["_source"]
+        finally:
+            pages.close()
+
+    def _paginate(
+        self,
+        index: str,
+        body: Dict[str, Any],
+        size: int,
+        request_cache: Optional[bool] = None,
+        slices: int = 1,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Run a search using a point in time and return an iterator over its pages.
+
+        Pages are retrieved with `search_after`, sorted by `_shard_doc`, so that
+        each request is independent of the others. If there is more than one
+        slice, each slice is searched on its own background thread.
+
+        Args:
+            index: The name of the index to query
+            body: The search request body
+            size: Number of documents to retrieve per search request
+            request_cache: Optional override for whether to use the shard request cache
+            slices: Number of slices to split the search into (default: 1)
+
+        Returns:
+            An iterator yielding the list of hits in each non-empty page
+        """
+        # Open a point in time, whose ID is updated as pages are retrieved
+        pit = {"id": self._client.open_point_in_time(index=index, keep_alive=KEEP_ALIVE)["id"]}
+
+        pages: Generator[List[Dict[str, Any]], None, None]
+        if slices > 1:
+            pages = _merge(
+                [
+                    self._search_pages(
+                        pit=pit,
+                        body={**body, "slice": {"id": i, "max": slices}},
+                        size=size,
+                        request_cache=request_cache,
+                    )
+                    for i in range(slices)
+                ],
+                slices,
+            )
+        else:
+            pages = self._search_pages(
+                pit=pit,
+                body=body,
+                size=size,
+                request_cache=request_cache,
+            )
+
+        try:
+            yield from pages
 
         finally:
-            # Clean up the scroll context
-            if scroll_id:
-                try:
-                    self._client.clear_scroll(scroll_id=scroll_id)
-                except Exception:  # pylint: disable=broad-exception-caught
-                    # Ignore errors when clearing scroll - cleanup failures
-                    # should not mask results
-                    pass
+            pages.close()
+
+            # Clean up the point in time
+            try:
+                self._client.close_point_in_time(id=pit["id"])
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Ignore errors when closing the point in time - cleanup
+                # failures should not mask results
+                pass
+
+    def _search_pages(
+        self,
+        pit: Dict[str, str],
+        body: Dict[str, Any],
+        size: int,
+        request_cache: Optional[bool] = None,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Search a point in time and return an iterator over the pages of results.
+
+        Args:
+            pit: Holds the ID of the point in time, which is updated with the
+                ID returned by each search so that the latest one is closed
+            body: The search request body
+            size: Number of documents to retrieve per search request
+            request_cache: Optional override for whether to use the shard request cache
+
+        Returns:
+            An iterator yielding the list of hits in each non-empty page
+        """
+        search_after: Optional[List[Any]] = None
+
+        # Continue searching until no more results
+        while True:
+            page_body = build_page_body(body, pit["id"], size, search_after)
+            response = self._client.search(body=page_body, request_cache=request_cache)
+            pit["id"] = response.get("pit_id", pit["id"])
+            hits = response["hits"]["hits"]
+
+            if not hits:
+                break
+
+            yield hits
+            search_after = hits[-1]["sort"]
 
     def close(self) -> None:
         """
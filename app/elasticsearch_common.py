@@ -0,0 +1,143 @@
+"""
+Helpers shared by the synchronous and asynchronous Elasticsearch clients.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from elasticsearch.serializer import OrjsonSerializer
+
+# How long to keep a point in time alive between requests
+KEEP_ALIVE = "2m"
+
+# The maximum size of a single bulk request, in bytes
+MAX_CHUNK_BYTES = 10 * 1024 * 1024
+
+# The search request body for matching all documents (must not be modified)
+MATCH_ALL: Dict[str, Any] = {"query": {"match_all": {}}}
+
+# The sort order for paging through a point in time (must not be modified)
+SORT: List[Dict[str, Any]] = [{"_shard_doc": "asc"}]
+
+
+def expand_action(index: str) -> Callable[[Any], Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Build a bulk helper callback that indexes each document into `index`.
+
+    A single action line is shared among all the documents, rather than
+    wrapping each document in its own action.
+
+    Args:
+        index: The name of the index to upload to
+
+    Returns:
+        A callback for the `expand_action_callback` argument of the bulk helpers
+    """
+    action: Dict[str, Any] = {"index": {"_index": index}}
+
+    def expand(document: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return action, document
+
+    return expand
+
+
+def build_connection_params(
+    endpoint: str,
+    api_key: str,
+    ca_cert: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the keyword arguments for constructing an Elasticsearch client.
+
+    Args:
+        endpoint: The Elasticsearch API endpoint URL
+        api_key: The API key for authentication
+        ca_cert: Optional path to the CA certificate file for TLS verification
+
+    Returns:
+        The connection parameters (as a dictionary)
+    """
+    connection_params: Dict[str, Any] = {
+        "hosts": [endpoint],
+        "api_key": api_key,
+        # Keep a pool of persistent connections so that concurrent and
+        # consecutive requests reuse sockets instead of reconnecting
+        "connections_per_node": 32,
+        "http_compress": True,
+        "request_timeout": 30,
+        # Retrying after a timeout can index a document twice if the server
+        # completed the request, so uploads without a document ID turn this off
+        "retry_on_timeout": True,
+        # Encode and decode JSON request and response bodies with orjson
+        "serializer": OrjsonSerializer(),
+    }
+
+    # Add CA certificate if provided
+    if ca_cert is not None:
+        connection_params["ca_certs"] = ca_cert
+        connection_params["verify_certs"] = True
+
+    return connection_params
+
+
+def build_query_body(
+    query: Optional[Dict[str, Any]] = None,
+    query_string: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build a search request body from a Query DSL query or a query string.
+
+    Args:
+        query: Optional Query DSL query (as a dictionary)
+        query_string: Optional Kibana-style query string
+
+    Returns:
+        The search request body (as a dictionary), which must not be modified
+    """
+    if query is None and query_string is None:
+        # If no query provided, match all documents
+        return MATCH_ALL
+
+    query_body: Dict[str, Any] = {}
+
+    if query is not None:
+        # Use the provided Query DSL query
+        query_body["query"] = query
+    elif query_string is not None:
+        # Convert query string to Query DSL
+        query_body["query"] = {
+            "query_string": {
+                "query": query_string,
+            }
+        }
+
+    return query_body
+
+
+def build_page_body(
+    body: Dict[str, Any],
+    pit_id: str,
+    size: int,
+    search_after: Optional[List[Any]],
+) -> Dict[str, Any]:
+    """
+    Build the search request body for one page of a point in time search.
+
+    Args:
+        body: The search request body
+        pit_id: The ID of the point in time
+        size: Number of documents to retrieve
+        search_after: The sort values of the last hit on the previous page, if any
+
+    Returns:
+        The search request body for the page (as a dictionary)
+    """
+    page_body = {
+        **body,
+        "pit": {"id": pit_id, "keep_alive": KEEP_ALIVE},
+        "sort": SORT,
+        "size": size,
+        "track_total_hits": False,
+    }
+    if search_after is not None:
+        page_body["search_after"] = search_after
+    return page_body
@@ -2,12 +2,47 @@
 
 import argparse
 import smtplib
+import ssl
 import sys
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Optional, Tuple
+
+
+@lru_cache(maxsize=32)
+def _cached_text(path: str, mtime_ns: int, size: int) -> str:
+    """Read a text file.
+
+    The modification time and size are part of the cache key so that a
+    changed file is read again.
+
+    Args:
+        path: Path to the file
+        mtime_ns: The file's modification time, in nanoseconds
+        size: The file's size, in bytes
+
+    Returns:
+        The file's contents
+    """
+    del mtime_ns, size  # only used as part of the cache key
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _load_part(path: Path, subtype: str) -> MIMEText:
+    """Load a file as a new MIME text part, reusing its cached contents if unchanged.
+
+    Args:
+        path: Path to the file
+        subtype: The MIME subtype of the part (e.g., "plain" or "html")
+
+    Returns:
+        A MIMEText part containing the file's contents
+    """
+    st = path.stat()
+    return MIMEText(_cached_text(str(path), st.st_mtime_ns, st.st_size), subtype)
 
 
 def create_message(
@@ -46,17 +81,118 @@ def create_message(
 
     # Read and attach plain text content
     if text_file:
-        text_content = text_file.read_text(encoding="utf-8")
-        msg.attach(MIMEText(text_content, "plain"))
+        msg.attach(_load_part(text_file, "plain"))
 
     # Read and attach HTML content
     if html_file:
-        html_content = html_file.read_text(encoding="utf-8")
-        msg.attach(MIMEText(html_content, "html"))
+        msg.attach(_load_part(html_file, "html"))
 
     return msg
 
 
+class SMTPSession:
+    """A connection to an SMTP server that can be used to send many messages.
+
+    Reusing one connection avoids repeating the connection setup, TLS
+    handshake, and authentication for each message.
+
+    Example:
+        with SMTPSession("smtp.example.com", 465, use_ssl=True) as session:
+            for message in messages:
+                session.send(message, sender_email, message["To"])
+    """
+
+    def __init__(
+        self,
+        smtp_host: str,
+        smtp_port: int,
+        use_ssl: bool,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> None:
+        """Initialize the session without connecting to the server.
+
+        Args:
+            smtp_host: SMTP server hostname
+            smtp_port: SMTP server port
+            use_ssl: Whether to use SSL/TLS
+            username: Username for authentication (optional)
+            password: Password for authentication (optional)
+        """
+        self._smtp_host = smtp_host
+        self._smtp_port = smtp_port
+        self._use_ssl = use_ssl
+        self._username = username
+        self._password = password
+        self._server: Optional[smtplib.SMTP] = None
+
+    def __enter__(self) -> "SMTPSession":
+        """Connect to the server and, if credentials were given, log in.
+
+        Without SSL/TLS, the connection is upgraded with STARTTLS before
+        logging in, so that credentials are never sent in the clear.
+        """
+        server: smtplib.SMTP
+        if self._use_ssl:
+            server = smtplib.SMTP_SSL(self._smtp_host, self._smtp_port)
+        else:
+            server = smtplib.SMTP(self._smtp_host, self._smtp_port)
+
+        try:
+            if self._username is not None and self._password is not None:
+                if not self._use_ssl:
+                    server.starttls(context=ssl.create_default_context())
+                server.login(self._username, self._password)
+        except BaseException:
+            server.close()
+            raise
+
+        self._server = server
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Disconnect from the server."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except smtplib.SMTPServerDisconnected:
+            pass
+        finally:
+            server.close()
+
+    def send(self, message: MIMEMultipart, sender_email: str, recipient_email: str) -> None:
+        """Send an email message over this session's connection.
+
+        Args:
+            message: The message to send
+            sender_email: The sender's email address
+            recipient_email: The recipient's email address
+
+        Raises:
+            smtplib.SMTPServerDisconnected: If the session is not connected
+        """
+        if self._server is None:
+            raise smtplib.SMTPServerDisconnected("SMTP session is not connected")
+        self._server.send_message(message, sender_email, recipient_email)
+
+    def send_many(self, messages: Iterable[Tuple[MIMEMultipart, str, str]]) -> int:
+        """Send several email messages over this session's connection.
+
+        Args:
+            messages: (message, sender email, recipient email) tuples
+
+        Returns:
+            The number of messages sent
+        """
+        count = 0
+        for message, sender_email, recipient_email in messages:
+            self.send(message, sender_email, recipient_email)
+            count += 1
+        return count
+
+
 def send_email(
     smtp_host: str,
     smtp_port: int,
@@ -64,6 +200,8 @@ def send_email(
     sender_email: str,
     recipient_email: str,
     message: MIMEMultipart,
+    *,
+    session: Optional[SMTPSession] = None,
 ) -> None:
     """Send an email message via SMTP.
 
@@ -74,13 +212,16 @@ def send_email(
         sender_email: The sender's email address
         recipient_email: The recipient's email address
         message: The message to send
+        session: An open session to send the message over (optional). It must
+            be connected to the given SMTP server. If not provided, a new
+            connection is made just for this message
     """
-    if use_ssl:
-        with smtplib.SMTP_SSL(smtp_host, smtp_port) as server:
-            server.send_message(message, sender_email, recipient_email)
-    else:
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.send_message(message, sender_email, recipient_email)
+    if session is not None:
+        session.send(message, sender_email, recipient_email)
+        return
+
+    with SMTPSession(smtp_host, smtp_port, use_ssl) as new_session:
+        new_session.send(message, sender_email, recipient_email)
 
 
 def parse_arguments() -> argparse.Namespace: